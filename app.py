@@ -33,7 +33,9 @@ def send():
         extracted_data = OFF.get_data(product_name)
         
         # Extract relevant product information for the table
-        products = OFF.product_info_extraction(extracted_data)
+        # get_data returns a list, but product_info_extraction works on a
+        # single product dict, so map it over the results
+        products = [OFF.product_info_extraction(p) for p in extracted_data]
 
         # Render the HTML template with the product data
         return render_template('products.html', products=products)
@@ -1,11 +1,32 @@
 
 import requests
-import google.generativeai as genai
+
+# orjson parses the raw response bytes directly (no utf-8 decode pass) and is
+# several times faster than stdlib json on the large search payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One pooled HTTP session shared by all OpenFoodFacts calls; reusing the
+# TCP/TLS connection saves a handshake per search
+http_session = requests.Session()
+
+# Keys of the dict returned by product_info_extraction, cached once so the
+# per-product dict is built via dict(zip(...)) instead of a fresh literal
+PRODUCT_INFO_KEYS = ("name", "brand", "image_url", "web_url")
 
 class OpenFoodFacts:
+    def __init__(self):
+        # Repeated searches for the same product name skip the network
+        self.search_cache = {}
+
     # Function to get data from OpenFoodFacts API
     def get_data(self,product_name):
-        
+        cached = self.search_cache.get(product_name)
+        if cached is not None:
+            return cached
+
         url = "https://world.openfoodfacts.org/cgi/search.pl"
         params = {
             'search_terms': product_name,
@@ -15,9 +36,11 @@ class OpenFoodFacts:
             'tag_contains_0': 'contains',
             'tag_0': 'India',
         }
-        response = requests.get(url, params=params)
-        data = response.json()
-        return data['products'][:5]  # Return top 5 results
+        response = http_session.get(url, params=params)
+        data = orjson.loads(response.content) if orjson else response.json()
+        products = data['products'][:5]  # Return top 5 results
+        self.search_cache[product_name] = products
+        return products
 
     # Function to extract specific info from product
     def product_info_extraction(self,product):
@@ -25,10 +48,13 @@ class OpenFoodFacts:
         brand = product.get('brands', 'Not mentioned')
         image_url = product.get('image_url', 'Not mentioned')
         web_url = product.get('url', 'Not mentioned')
-        return {"name": name, "brand": brand, "image_url": image_url, "web_url": web_url}
+        return dict(zip(PRODUCT_INFO_KEYS, (name, brand, image_url, web_url)))
 
     # Function to generate LLM prompt
     def LLM(self,product, tone):
+        # Imported here so app startup does not pay for the heavy
+        # google.generativeai import when no summary is ever requested
+        import google.generativeai as genai
         name = product.get('product_name', 'Not mentioned')
         brand = product.get('brands', 'Not mentioned')
         nutriscore_grade = product.get('nutriscore_grade', 'Not mentioned')